@@ -131,18 +131,23 @@ fn generate_solid_png(
     let g = ((hash_val >> 8) & 0xFF) as u8;
     let b = (hash_val & 0xFF) as u8;
 
-    let mut img_data = Vec::with_capacity((width * height * 4) as usize);
-    for _ in 0..(width * height) {
-        img_data.extend_from_slice(&[r, g, b, 255]);
-    }
-
     let path = output_dir.join(format!("{}.png", name));
-    let img = image::RgbaImage::from_raw(width, height, img_data).ok_or_else(|| {
-        FlintError::GenerationError("Failed to create image buffer".to_string())
-    })?;
-    img.save(&path).map_err(|e| {
+    let img = image::RgbaImage::from_pixel(width, height, image::Rgba([r, g, b, 255]));
+    let save_err = |e: &dyn std::fmt::Display| {
         FlintError::GenerationError(format!("Failed to save PNG: {}", e))
-    })?;
+    };
+    let file = std::fs::File::create(&path).map_err(|e| save_err(&e))?;
+    let mut writer = std::io::BufWriter::new(file);
+    use std::io::Write;
+
+    // Placeholder output: favor encode speed over file size
+    let encoder = image::codecs::png::PngEncoder::new_with_quality(
+        &mut writer,
+        image::codecs::png::CompressionType::Fast,
+        image::codecs::png::FilterType::Adaptive,
+    );
+    img.write_with_encoder(encoder).map_err(|e| save_err(&e))?;
+    writer.flush().map_err(|e| save_err(&e))?;
 
     Ok(path)
 }
@@ -222,7 +227,8 @@ fn generate_minimal_glb(output_dir: &Path, name: &str) -> Result<std::path::Path
         12 + 8 + json_padded.len() as u32 + 8 + bin_data.len() as u32;
 
     let path = output_dir.join(format!("{}.glb", name));
-    let mut file = std::fs::File::create(&path)?;
+    // Buffer the header and chunk writes so they reach disk in one flush
+    let mut file = std::io::BufWriter::new(std::fs::File::create(&path)?);
     use std::io::Write;
 
     // Header
@@ -239,6 +245,7 @@ fn generate_minimal_glb(output_dir: &Path, name: &str) -> Result<std::path::Path
     file.write_all(&(bin_data.len() as u32).to_le_bytes())?;
     file.write_all(&0x004E4942u32.to_le_bytes())?; // "BIN\0"
     file.write_all(&bin_data)?;
+    file.flush()?;
 
     Ok(path)
 }
@@ -255,34 +262,36 @@ fn generate_silence_wav(
     let num_samples = (sample_rate as f64 * duration_secs) as u32;
     let data_size = num_samples * (bits_per_sample / 8) as u32 * num_channels as u32;
 
-    let path = output_dir.join(format!("{}.wav", name));
-    let mut file = std::fs::File::create(&path)?;
-    use std::io::Write;
+    // Pack the 44-byte header and sample data into one buffer so the file
+    // is written with a single call
+    let mut wav = Vec::with_capacity(44 + data_size as usize);
 
     // RIFF header
-    file.write_all(b"RIFF")?;
-    file.write_all(&(36 + data_size).to_le_bytes())?;
-    file.write_all(b"WAVE")?;
+    wav.extend_from_slice(b"RIFF");
+    wav.extend_from_slice(&(36 + data_size).to_le_bytes());
+    wav.extend_from_slice(b"WAVE");
 
     // fmt chunk
-    file.write_all(b"fmt ")?;
-    file.write_all(&16u32.to_le_bytes())?; // chunk size
-    file.write_all(&1u16.to_le_bytes())?; // PCM format
-    file.write_all(&num_channels.to_le_bytes())?;
-    file.write_all(&sample_rate.to_le_bytes())?;
+    wav.extend_from_slice(b"fmt ");
+    wav.extend_from_slice(&16u32.to_le_bytes()); // chunk size
+    wav.extend_from_slice(&1u16.to_le_bytes()); // PCM format
+    wav.extend_from_slice(&num_channels.to_le_bytes());
+    wav.extend_from_slice(&sample_rate.to_le_bytes());
     let byte_rate = sample_rate * num_channels as u32 * (bits_per_sample / 8) as u32;
-    file.write_all(&byte_rate.to_le_bytes())?;
+    wav.extend_from_slice(&byte_rate.to_le_bytes());
     let block_align = num_channels * (bits_per_sample / 8);
-    file.write_all(&block_align.to_le_bytes())?;
-    file.write_all(&bits_per_sample.to_le_bytes())?;
+    wav.extend_from_slice(&block_align.to_le_bytes());
+    wav.extend_from_slice(&bits_per_sample.to_le_bytes());
 
     // data chunk
-    file.write_all(b"data")?;
-    file.write_all(&data_size.to_le_bytes())?;
+    wav.extend_from_slice(b"data");
+    wav.extend_from_slice(&data_size.to_le_bytes());
 
-    // Write silence (zeros)
-    let silence = vec![0u8; data_size as usize];
-    file.write_all(&silence)?;
+    // Silence (zeros)
+    wav.resize(44 + data_size as usize, 0);
+
+    let path = output_dir.join(format!("{}.wav", name));
+    std::fs::write(&path, &wav)?;
 
     Ok(path)
 }
@@ -399,6 +408,9 @@ mod tests {
         let bytes = std::fs::read(path).unwrap();
         assert_eq!(&bytes[..4], b"RIFF");
         assert_eq!(&bytes[8..12], b"WAVE");
+        assert_eq!(&bytes[36..40], b"data");
+        // 1s of 16-bit mono at 44.1kHz after the 44-byte header
+        assert_eq!(bytes.len(), 44 + 44100 * 2);
 
         std::fs::remove_dir_all(&dir).ok();
     }
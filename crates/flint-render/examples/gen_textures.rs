@@ -2,20 +2,38 @@
 //!
 //! Run with: cargo run -p flint-render --example gen_textures
 
+use image::codecs::png::{CompressionType, FilterType, PngEncoder};
 use image::{Rgba, RgbaImage};
+use std::io::Write;
 use std::path::Path;
 
 fn main() {
     let out_dir = Path::new("demo/textures");
     std::fs::create_dir_all(out_dir).expect("Failed to create demo/textures");
 
-    generate_stone_wall(out_dir);
-    generate_wood_planks(out_dir);
-    generate_floor_tiles(out_dir);
+    // Generators are independent and CPU-bound, so run each on its own thread
+    std::thread::scope(|s| {
+        s.spawn(|| generate_stone_wall(out_dir));
+        s.spawn(|| generate_wood_planks(out_dir));
+        s.spawn(|| generate_floor_tiles(out_dir));
+    });
 
     println!("Generated textures in {}", out_dir.display());
 }
 
+/// Save a PNG with fast compression; encode time dominates at this size
+fn save_png(img: &RgbaImage, path: &Path) {
+    let file = std::fs::File::create(path).unwrap();
+    let mut writer = std::io::BufWriter::new(file);
+    let encoder = PngEncoder::new_with_quality(
+        &mut writer,
+        CompressionType::Fast,
+        FilterType::Adaptive,
+    );
+    img.write_with_encoder(encoder).unwrap();
+    writer.flush().unwrap();
+}
+
 /// Simple pseudo-random hash for deterministic noise
 fn hash(x: u32, y: u32, seed: u32) -> f32 {
     let n = x.wrapping_mul(374761393)
@@ -68,51 +86,54 @@ fn generate_stone_wall(out_dir: &Path) {
     let block_h = 32.0_f32; // block height in pixels
     let block_w = 64.0_f32; // block width in pixels
 
-    for y in 0..size {
-        for x in 0..size {
-            let row = (y as f32 / block_h).floor() as i32;
-            // Offset every other row for ashlar bond
-            let offset = if row % 2 == 0 { 0.0 } else { block_w * 0.5 };
-            let bx = ((x as f32 + offset) % block_w) / block_w;
-            let by = (y as f32 % block_h) / block_h;
-
-            // Mortar line detection
-            let mortar_h = 0.04; // horizontal mortar thickness
-            let mortar_v = 0.04; // vertical mortar thickness
-            let is_mortar = by < mortar_h || by > (1.0 - mortar_h)
-                || bx < mortar_v || bx > (1.0 - mortar_v);
-
-            if is_mortar {
-                // Mortar: light gray with subtle variation
-                let noise = fbm(x as f32 * 0.1, y as f32 * 0.1, 3, 42);
-                let v = (0.6 + noise * 0.15).clamp(0.0, 1.0);
-                let r = (v * 200.0) as u8;
-                let g = (v * 195.0) as u8;
-                let b = (v * 185.0) as u8;
-                img.put_pixel(x, y, Rgba([r, g, b, 255]));
-            } else {
-                // Stone block: warm gray-brown with per-block color variation
-                let block_seed = hash(
-                    ((x as f32 + offset) / block_w).floor() as u32,
-                    row as u32,
-                    123,
-                );
-                let noise = fbm(x as f32 * 0.05, y as f32 * 0.05, 4, 99);
-                let detail = fbm(x as f32 * 0.2, y as f32 * 0.2, 2, 77);
-
-                let base = 0.45 + block_seed * 0.2 + noise * 0.15 + detail * 0.05;
-                let base = base.clamp(0.0, 1.0);
-
-                // Warm sandstone tint
-                let r = (base * 210.0) as u8;
-                let g = (base * 195.0) as u8;
-                let b = (base * 170.0) as u8;
-                img.put_pixel(x, y, Rgba([r, g, b, 255]));
-            }
+    // Per-block color variation depends only on the block index, so hash it
+    // once per block. Offset rows spill into one extra column.
+    let block_cols = (size as f32 / block_w) as u32 + 1;
+    let block_rows = (size as f32 / block_h).ceil() as u32;
+    let block_seeds: Vec<f32> = (0..block_rows)
+        .flat_map(|row| (0..block_cols).map(move |col| hash(col, row, 123)))
+        .collect();
+
+    for (x, y, pixel) in img.enumerate_pixels_mut() {
+        let row = (y as f32 / block_h).floor() as i32;
+        // Offset every other row for ashlar bond
+        let offset = if row % 2 == 0 { 0.0 } else { block_w * 0.5 };
+        let bx = ((x as f32 + offset) % block_w) / block_w;
+        let by = (y as f32 % block_h) / block_h;
+
+        // Mortar line detection
+        let mortar_h = 0.04; // horizontal mortar thickness
+        let mortar_v = 0.04; // vertical mortar thickness
+        let is_mortar = by < mortar_h || by > (1.0 - mortar_h)
+            || bx < mortar_v || bx > (1.0 - mortar_v);
+
+        if is_mortar {
+            // Mortar: light gray with subtle variation
+            let noise = fbm(x as f32 * 0.1, y as f32 * 0.1, 3, 42);
+            let v = (0.6 + noise * 0.15).clamp(0.0, 1.0);
+            let r = (v * 200.0) as u8;
+            let g = (v * 195.0) as u8;
+            let b = (v * 185.0) as u8;
+            *pixel = Rgba([r, g, b, 255]);
+        } else {
+            // Stone block: warm gray-brown with per-block color variation
+            let col = ((x as f32 + offset) / block_w).floor() as u32;
+            let block_seed = block_seeds[(row as u32 * block_cols + col) as usize];
+            let noise = fbm(x as f32 * 0.05, y as f32 * 0.05, 4, 99);
+            let detail = fbm(x as f32 * 0.2, y as f32 * 0.2, 2, 77);
+
+            let base = 0.45 + block_seed * 0.2 + noise * 0.15 + detail * 0.05;
+            let base = base.clamp(0.0, 1.0);
+
+            // Warm sandstone tint
+            let r = (base * 210.0) as u8;
+            let g = (base * 195.0) as u8;
+            let b = (base * 170.0) as u8;
+            *pixel = Rgba([r, g, b, 255]);
         }
     }
 
-    img.save(out_dir.join("stone_wall.png")).unwrap();
+    save_png(&img, &out_dir.join("stone_wall.png"));
     println!("  stone_wall.png (256x256)");
 }
 
@@ -123,41 +144,44 @@ fn generate_wood_planks(out_dir: &Path) {
 
     let plank_width = 42.0_f32; // pixel width per plank
 
-    for y in 0..size {
-        for x in 0..size {
-            let plank = (x as f32 / plank_width).floor() as u32;
-            let bx = (x as f32 % plank_width) / plank_width;
-
-            // Gap between planks
-            let gap = 0.03;
-            let is_gap = bx < gap || bx > (1.0 - gap);
-
-            if is_gap {
-                img.put_pixel(x, y, Rgba([40, 30, 20, 255]));
-            } else {
-                // Per-plank base color variation
-                let plank_seed = hash(plank, 0, 555);
-                let plank_tone = 0.35 + plank_seed * 0.25;
-
-                // Wood grain: stretched noise along Y axis
-                let grain = fbm(x as f32 * 0.02 + plank as f32 * 30.0, y as f32 * 0.15, 4, 200);
-                let fine_grain = fbm(x as f32 * 0.1 + plank as f32 * 30.0, y as f32 * 0.5, 2, 300);
-
-                // Ring pattern via sine on the grain
-                let ring = ((grain * 12.0).sin() * 0.5 + 0.5) * 0.15;
-
-                let v = (plank_tone + grain * 0.12 + fine_grain * 0.05 + ring).clamp(0.0, 1.0);
-
-                // Warm brown tones
-                let r = (v * 195.0 + 30.0).min(255.0) as u8;
-                let g = (v * 145.0 + 20.0).min(255.0) as u8;
-                let b = (v * 95.0 + 15.0).min(255.0) as u8;
-                img.put_pixel(x, y, Rgba([r, g, b, 255]));
-            }
+    // Per-plank base tone, hashed once per plank
+    let plank_count = (size as f32 / plank_width).ceil() as u32;
+    let plank_tones: Vec<f32> = (0..plank_count)
+        .map(|plank| 0.35 + hash(plank, 0, 555) * 0.25)
+        .collect();
+
+    for (x, y, pixel) in img.enumerate_pixels_mut() {
+        let plank = (x as f32 / plank_width).floor() as u32;
+        let bx = (x as f32 % plank_width) / plank_width;
+
+        // Gap between planks
+        let gap = 0.03;
+        let is_gap = bx < gap || bx > (1.0 - gap);
+
+        if is_gap {
+            *pixel = Rgba([40, 30, 20, 255]);
+        } else {
+            // Per-plank base color variation
+            let plank_tone = plank_tones[plank as usize];
+
+            // Wood grain: stretched noise along Y axis
+            let grain = fbm(x as f32 * 0.02 + plank as f32 * 30.0, y as f32 * 0.15, 4, 200);
+            let fine_grain = fbm(x as f32 * 0.1 + plank as f32 * 30.0, y as f32 * 0.5, 2, 300);
+
+            // Ring pattern via sine on the grain
+            let ring = ((grain * 12.0).sin() * 0.5 + 0.5) * 0.15;
+
+            let v = (plank_tone + grain * 0.12 + fine_grain * 0.05 + ring).clamp(0.0, 1.0);
+
+            // Warm brown tones
+            let r = (v * 195.0 + 30.0).min(255.0) as u8;
+            let g = (v * 145.0 + 20.0).min(255.0) as u8;
+            let b = (v * 95.0 + 15.0).min(255.0) as u8;
+            *pixel = Rgba([r, g, b, 255]);
         }
     }
 
-    img.save(out_dir.join("wood_planks.png")).unwrap();
+    save_png(&img, &out_dir.join("wood_planks.png"));
     println!("  wood_planks.png (256x256)");
 }
 
@@ -168,44 +192,47 @@ fn generate_floor_tiles(out_dir: &Path) {
 
     let tile_size = 64.0_f32; // 256 / 4 = 64px per tile
 
-    for y in 0..size {
-        for x in 0..size {
-            let tx = (x as f32 % tile_size) / tile_size;
-            let ty = (y as f32 % tile_size) / tile_size;
-
-            let tile_ix = (x as f32 / tile_size).floor() as u32;
-            let tile_iy = (y as f32 / tile_size).floor() as u32;
-
-            // Grout lines
-            let grout = 0.035;
-            let is_grout = tx < grout || tx > (1.0 - grout)
-                || ty < grout || ty > (1.0 - grout);
-
-            if is_grout {
-                let noise = fbm(x as f32 * 0.15, y as f32 * 0.15, 2, 88);
-                let v = (0.35 + noise * 0.1).clamp(0.0, 1.0);
-                let c = (v * 140.0) as u8;
-                img.put_pixel(x, y, Rgba([c, c, (c as f32 * 1.05) as u8, 255]));
-            } else {
-                // Per-tile color variation
-                let tile_seed = hash(tile_ix, tile_iy, 999);
-                let base = 0.45 + tile_seed * 0.15;
-
-                // Surface variation
-                let noise = fbm(x as f32 * 0.06, y as f32 * 0.06, 4, 150);
-                let speckle = hash(x, y, 777) * 0.04;
-
-                let v = (base + noise * 0.12 + speckle).clamp(0.0, 1.0);
-
-                // Cool gray-blue slate tones
-                let r = (v * 175.0) as u8;
-                let g = (v * 178.0) as u8;
-                let b = (v * 190.0) as u8;
-                img.put_pixel(x, y, Rgba([r, g, b, 255]));
-            }
+    // Per-tile base tone, hashed once per tile
+    let tiles_per_row = (size as f32 / tile_size).ceil() as u32;
+    let tile_bases: Vec<f32> = (0..tiles_per_row)
+        .flat_map(|iy| (0..tiles_per_row).map(move |ix| 0.45 + hash(ix, iy, 999) * 0.15))
+        .collect();
+
+    for (x, y, pixel) in img.enumerate_pixels_mut() {
+        let tx = (x as f32 % tile_size) / tile_size;
+        let ty = (y as f32 % tile_size) / tile_size;
+
+        let tile_ix = (x as f32 / tile_size).floor() as u32;
+        let tile_iy = (y as f32 / tile_size).floor() as u32;
+
+        // Grout lines
+        let grout = 0.035;
+        let is_grout = tx < grout || tx > (1.0 - grout)
+            || ty < grout || ty > (1.0 - grout);
+
+        if is_grout {
+            let noise = fbm(x as f32 * 0.15, y as f32 * 0.15, 2, 88);
+            let v = (0.35 + noise * 0.1).clamp(0.0, 1.0);
+            let c = (v * 140.0) as u8;
+            *pixel = Rgba([c, c, (c as f32 * 1.05) as u8, 255]);
+        } else {
+            // Per-tile color variation
+            let base = tile_bases[(tile_iy * tiles_per_row + tile_ix) as usize];
+
+            // Surface variation
+            let noise = fbm(x as f32 * 0.06, y as f32 * 0.06, 4, 150);
+            let speckle = hash(x, y, 777) * 0.04;
+
+            let v = (base + noise * 0.12 + speckle).clamp(0.0, 1.0);
+
+            // Cool gray-blue slate tones
+            let r = (v * 175.0) as u8;
+            let g = (v * 178.0) as u8;
+            let b = (v * 190.0) as u8;
+            *pixel = Rgba([r, g, b, 255]);
         }
     }
 
-    img.save(out_dir.join("floor_tiles.png")).unwrap();
+    save_png(&img, &out_dir.join("floor_tiles.png"));
     println!("  floor_tiles.png (256x256)");
 }